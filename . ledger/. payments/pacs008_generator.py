@@ -1,8 +1,34 @@
 from lxml import etree
+import os
+import secrets
+import time
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Iterable, Iterator, List, Mapping, Optional
+
+PACS008_NS = "urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"
+
+# Build message trees with etree.SubElement (or parent.makeelement) only.
+# Creating a detached etree.Element and .append()-ing it into another tree
+# makes lxml merge documents and fix up namespaces on every append, which
+# goes quadratic on high-fanout messages. Reusable blocks must be
+# copy.deepcopy()'d from a template, never moved between trees.
+
+@lru_cache(maxsize=1)
+def _iso_now_sec(epoch_sec: int) -> str:
+    # CreDtTm is second-precision, so format each second only once
+    return datetime.fromtimestamp(epoch_sec, timezone.utc).isoformat(timespec='seconds')
+
+def _batch_uuids(n: int) -> List[uuid.UUID]:
+    # One urandom read for n version-4 UUIDs instead of n uuid4() calls
+    buf = os.urandom(16 * n)
+    return [uuid.UUID(bytes=buf[i*16:(i+1)*16], version=4) for i in range(n)]
+
+def _uuid_stream(block: int = 512) -> Iterator[uuid.UUID]:
+    while True:
+        yield from _batch_uuids(block)
 
 def generate_pacs_008(
     sender_iban: str,
@@ -11,16 +37,18 @@ def generate_pacs_008(
     currency: str = "USD",
     end_to_end_id: Optional[str] = None,
     remittance_info: Optional[str] = None,
-    settlement_method: str = "INST"
+    settlement_method: str = "INST",
+    pretty: bool = False
 ) -> bytes:
-    nsmap = {None: "urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"}
+    nsmap = {None: PACS008_NS}
     root = etree.Element("Document", nsmap=nsmap)
     fitofi = etree.SubElement(root, "FIToFICstmrCdtTrf")
+    msg_id, tx_id = _batch_uuids(2)
 
     # Group Header
     grp_hdr = etree.SubElement(fitofi, "GrpHdr")
-    etree.SubElement(grp_hdr, "MsgId").text = str(uuid.uuid4())
-    etree.SubElement(grp_hdr, "CreDtTm").text = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    etree.SubElement(grp_hdr, "MsgId").text = str(msg_id)
+    etree.SubElement(grp_hdr, "CreDtTm").text = _iso_now_sec(int(time.time()))
     etree.SubElement(grp_hdr, "NbOfTxs").text = "1"
     etree.SubElement(grp_hdr, "CtrlSum").text = f"{amount:.2f}"
 
@@ -30,9 +58,9 @@ def generate_pacs_008(
     # Transaction
     tx = etree.SubElement(fitofi, "CdtTrfTxInf")
     pmt_id = etree.SubElement(tx, "PmtId")
-    etree.SubElement(pmt_id, "InstrId").text = f"INST-{uuid.uuid4().hex[:8]}"
-    etree.SubElement(pmt_id, "EndToEndId").text = end_to_end_id or f"E2E-{uuid.uuid4().hex[:12]}"
-    etree.SubElement(pmt_id, "TxId").text = str(uuid.uuid4())
+    etree.SubElement(pmt_id, "InstrId").text = f"INST-{secrets.token_hex(4)}"
+    etree.SubElement(pmt_id, "EndToEndId").text = end_to_end_id or f"E2E-{secrets.token_hex(6)}"
+    etree.SubElement(pmt_id, "TxId").text = str(tx_id)
 
     instd_amt = etree.SubElement(tx, "InstdAmt", Ccy=currency)
     instd_amt.text = f"{amount:.2f}"
@@ -53,4 +81,70 @@ def generate_pacs_008(
         rmt_inf = etree.SubElement(tx, "RmtInf")
         etree.SubElement(rmt_inf, "Ustrd").text = remittance_info[:140]
 
-    return etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="UTF-8")
+    return etree.tostring(root, pretty_print=pretty, xml_declaration=True, encoding="UTF-8")
+
+
+def _party(tag: str, name: str) -> etree._Element:
+    party = etree.Element(tag)
+    etree.SubElement(party, "Nm").text = name
+    return party
+
+# Static party blocks, serialized as-is into every streamed message. They are
+# only ever passed to xmlfile.write(), never appended into another tree.
+_DBTR = _party("Dbtr", "Sender Name")
+_CDTR = _party("Cdtr", "Receiver Name")
+
+def _leaf(xf, tag: str, text: str, **attrib: str) -> None:
+    with xf.element(tag, attrib):
+        xf.write(text)
+
+def _account(xf, tag: str, iban: str) -> None:
+    with xf.element(tag):
+        with xf.element("Id"):
+            _leaf(xf, "IBAN", iban)
+
+def generate_pacs_008_stream(out_fileobj: BinaryIO, records_iter: Iterable[Mapping[str, Any]]) -> int:
+    """Stream a pacs.008 Document with one FIToFICstmrCdtTrf per record.
+
+    Records take the same keys as ``generate_pacs_008``. Elements are written
+    to ``out_fileobj`` as they are produced instead of building a tree per
+    message. Returns the number of records written.
+    """
+    count = 0
+    ids = _uuid_stream()
+    with etree.xmlfile(out_fileobj, encoding="UTF-8") as xf:
+        xf.write_declaration()
+        with xf.element("Document", nsmap={None: PACS008_NS}):
+            for rec in records_iter:
+                amount = f"{rec['amount']:.2f}"
+                end_to_end_id = rec.get("end_to_end_id")
+                remittance_info = rec.get("remittance_info")
+
+                with xf.element("FIToFICstmrCdtTrf"):
+                    with xf.element("GrpHdr"):
+                        _leaf(xf, "MsgId", str(next(ids)))
+                        _leaf(xf, "CreDtTm", _iso_now_sec(int(time.time())))
+                        _leaf(xf, "NbOfTxs", "1")
+                        _leaf(xf, "CtrlSum", amount)
+                        with xf.element("SttlmInf"):
+                            _leaf(xf, "SttlmMtd", rec.get("settlement_method", "INST"))
+
+                    with xf.element("CdtTrfTxInf"):
+                        with xf.element("PmtId"):
+                            _leaf(xf, "InstrId", f"INST-{secrets.token_hex(4)}")
+                            _leaf(xf, "EndToEndId", end_to_end_id or f"E2E-{secrets.token_hex(6)}")
+                            _leaf(xf, "TxId", str(next(ids)))
+
+                        _leaf(xf, "InstdAmt", amount, Ccy=rec.get("currency", "USD"))
+
+                        xf.write(_DBTR)
+                        _account(xf, "DbtrAcct", rec["sender_iban"])
+                        xf.write(_CDTR)
+                        _account(xf, "CdtrAcct", rec["receiver_iban"])
+
+                        if remittance_info:
+                            with xf.element("RmtInf"):
+                                _leaf(xf, "Ustrd", remittance_info[:140])
+                xf.flush()
+                count += 1
+    return count
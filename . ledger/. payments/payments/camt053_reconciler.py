@@ -1,39 +1,54 @@
-import xml.etree.ElementTree as ET
-from decimal import Decimal
+import io
+import re
+import sys
+from lxml import etree
+from decimal import Decimal, InvalidOperation
 from typing import Dict, Any
 
+CAMT053_NS = "urn:iso:std:iso:20022:tech:xsd:camt.053.001.02"
+# Clark-notation tags, resolved once instead of per find() call
+NTRY = f"{{{CAMT053_NS}}}Ntry"
+AMT = f"{{{CAMT053_NS}}}Amt"
+CDTDBTIND = f"{{{CAMT053_NS}}}CdtDbtInd"
+ACCTSVCRREF = f"{{{CAMT053_NS}}}AcctSvcrRef"
+_XML_DECL = re.compile(r"^\s*<\?xml[^>]*\?>")
+
 class ReconciliationError(Exception):
     pass
 
-def reconcile_camt053(xml_content_or_path: str, currency: str = "USD") -> Dict[str, Any]:
-    # Load XML (file or string)
+def reconcile_camt053(xml_content_or_path: str, currency: str = "USD", verbose: bool = False) -> Dict[str, Any]:
+    # Load XML (file or string) as a stream; only <Ntry> end events are delivered
     if xml_content_or_path.endswith('.xml'):
-        tree = ET.parse(xml_content_or_path)
+        source = xml_content_or_path
     else:
-        root = ET.fromstring(xml_content_or_path)
-        tree = ET.ElementTree(root)
-
-    root = tree.getroot()
-    ns = {'ns': 'urn:iso:std:iso:20022:tech:xsd:camt.053.001.02'}
+        # A str is already decoded; drop any encoding declaration so lxml
+        # doesn't re-decode our UTF-8 bytes as e.g. ISO-8859-1
+        text = _XML_DECL.sub("", xml_content_or_path, count=1)
+        source = io.BytesIO(text.encode("utf-8"))
 
     summary = {"total_entries": 0, "issues": [], "drift": Decimal("0.00")}
+    rows = [] if verbose else None
 
-    for stmt in root.findall('.//ns:Stmt', ns):
-        for ntry in stmt.findall('.//ns:Ntry', ns):
+    for _, ntry in etree.iterparse(source, events=("end",), tag=NTRY):
+        try:
             summary["total_entries"] += 1
 
-            amt_elem = ntry.find('ns:Amt', ns)
-            if not amt_elem:
+            amt_elem = ntry.find(AMT)
+            if amt_elem is None:
+                continue
+
+            # Filter on currency before paying for the Decimal parse
+            ccy = amt_elem.get('Ccy', 'unknown')
+            if currency and ccy != currency:
                 continue
 
             try:
                 amount = Decimal(amt_elem.text.strip())
-            except:
+            except (InvalidOperation, AttributeError):
                 summary["issues"].append("Invalid amount")
                 continue
 
-            ccy = amt_elem.get('Ccy', 'unknown')
-            cd_dbt = ntry.find('ns:CdtDbtInd', ns)
+            cd_dbt = ntry.find(CDTDBTIND)
             direction = cd_dbt.text if cd_dbt is not None else None
 
             if direction not in ("CRDT", "DBIT"):
@@ -43,12 +58,28 @@ def reconcile_camt053(xml_content_or_path: str, currency: str = "USD") -> Dict[s
             summary["drift"] += signed
 
             # In real code: match against TigerBeetle using AcctSvcrRef / EndToEndId
-            ref = ntry.find('ns:AcctSvcrRef', ns)
+            ref = ntry.find(ACCTSVCRREF)
             ref_text = ref.text if ref is not None else "no-ref"
 
-            print(f"Entry: {signed:+.2f} {ccy}  | Ref: {ref_text}")
+            if verbose:
+                rows.append((signed, ccy, ref_text))
+        finally:
+            _release(ntry)
+
+    # One write for the whole statement instead of a print per entry
+    if rows:
+        sys.stdout.write("\n".join(f"Entry: {amt:+.2f} {c}  | Ref: {r}" for amt, c, r in rows) + "\n")
 
     if abs(summary["drift"]) > Decimal("0.01"):
         raise ReconciliationError(f"Drift detected: {summary['drift']:+.2f}")
 
     return summary
+
+def _release(elem) -> None:
+    # Free the processed entry and every sibling already seen so memory stays
+    # flat regardless of statement size.
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
@@ -1,3 +1,18 @@
+# ISO 13616 character values: digits map to 0-9, letters A-Z to 10-35
+_IBAN_VALUES = {c: int(c, 36) for c in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+
+def _mod97(s: str) -> int:
+    # Streaming ISO 7064 Mod 97-10: fold one character at a time so the
+    # expanded number never has to be materialized as a bigint.
+    d = 0
+    for c in s:
+        try:
+            v = _IBAN_VALUES[c]
+        except KeyError:
+            raise ValueError(f"Invalid IBAN character: {c!r}") from None
+        d = (d * (100 if v > 9 else 10) + v) % 97
+    return d
+
 def generate_iban(country_code: str, bank_code: str, account_number: str) -> str:
     """Generate IBAN check digits (ISO 7064 Mod 97-10). For testing/simulation only."""
     country_code = country_code.upper()
@@ -5,10 +20,6 @@ def generate_iban(country_code: str, bank_code: str, account_number: str) -> str
         raise ValueError("Country code must be 2 letters")
 
     bban = (bank_code + account_number).replace(" ", "")
-    temp = bban + country_code + "00"
-
-    expanded = "".join(str(ord(c.upper()) - 55) if c.isalpha() else c for c in temp)
-    remainder = int(expanded) % 97
-    check = 98 - remainder
+    check = 98 - _mod97(bban.upper() + country_code + "00")
 
     return f"{country_code}{check:02d}{bban}"
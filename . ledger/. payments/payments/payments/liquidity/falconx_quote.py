@@ -1,8 +1,19 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Union
 from decimal import Decimal
 
+# Shared keep-alive session: quotes reuse pooled TLS connections instead of
+# paying a fresh DNS + TCP + TLS handshake on every call.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+))
+
 class FalconXAPIError(Exception):
     pass
 
@@ -31,7 +42,7 @@ def get_conversion_quote(
     }
 
     try:
-        r = requests.post(url, json=payload, headers=headers, timeout=timeout)
+        r = _SESSION.post(url, json=payload, headers=headers, timeout=timeout)
         r.raise_for_status()
         data = r.json()
 
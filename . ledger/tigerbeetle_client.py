@@ -1,4 +1,6 @@
+import time
 import uuid
+from typing import Iterable
 from tigerbeetle import Client, Account, Transfer, AccountFlags, CreateAccountError, CreateTransferError
 
 # Connect to TigerBeetle cluster (replace with real addresses in production)
@@ -8,16 +10,20 @@ client = Client(cluster_id=0, replica_addresses=["3000"])  # e.g. "3000,3001,300
 VAULT_ACCOUNT_CODE = 1001          # Assets (vault / settlement)
 CUSTOMER_DEPOSIT_CODE = 2001       # Liabilities (customer custody)
 
-def create_account(account_id: int, code: int, ledger: int = 1) -> bool:
-    """Create a single account with strict flags."""
-    account = Account(
+# TigerBeetle accepts at most 8190 events per request
+MAX_BATCH = 8190
+
+def build_account(account_id: int, code: int, ledger: int = 1) -> Account:
+    return Account(
         id=account_id,
         user_data_128=0,
         user_data_64=0,
         user_data_32=0,
         ledger=ledger,
         code=code,
-        flags=AccountFlags.LINKED if code == CUSTOMER_DEPOSIT_CODE else AccountFlags.DEBITS_MUST_NOT_EXCEED_CREDITS,
+        # Customer accounts stand alone; a LINKED flag here would open a chain
+        # that nothing closes and the whole request would be rejected
+        flags=0 if code == CUSTOMER_DEPOSIT_CODE else AccountFlags.DEBITS_MUST_NOT_EXCEED_CREDITS,
         debits_pending=0,
         debits_posted=0,
         credits_pending=0,
@@ -25,16 +31,8 @@ def create_account(account_id: int, code: int, ledger: int = 1) -> bool:
         timestamp=0
     )
 
-    errors = client.create_accounts([account])
-    if errors:
-        for idx, err in errors:
-            print(f"Account creation failed at index {idx}: {err}")
-        return False
-    return True
-
-def create_large_deposit(vault_id: int, customer_id: int, amount_units: int):
-    """Example: Deposit $100T scaled to 10^18 precision."""
-    transfer = Transfer(
+def build_deposit(vault_id: int, customer_id: int, amount_units: int) -> Transfer:
+    return Transfer(
         id=uuid.uuid4().int,
         debit_account_id=vault_id,
         credit_account_id=customer_id,
@@ -50,6 +48,21 @@ def create_large_deposit(vault_id: int, customer_id: int, amount_units: int):
         timestamp=0
     )
 
+def create_account(account_id: int, code: int, ledger: int = 1) -> bool:
+    """Create a single account with strict flags."""
+    account = build_account(account_id, code, ledger)
+
+    errors = client.create_accounts([account])
+    if errors:
+        for idx, err in errors:
+            print(f"Account creation failed at index {idx}: {err}")
+        return False
+    return True
+
+def create_large_deposit(vault_id: int, customer_id: int, amount_units: int):
+    """Example: Deposit $100T scaled to 10^18 precision."""
+    transfer = build_deposit(vault_id, customer_id, amount_units)
+
     errors = client.create_transfers([transfer])
     if errors:
         for idx, err in errors:
@@ -60,14 +73,135 @@ def create_large_deposit(vault_id: int, customer_id: int, amount_units: int):
     return True
 
 
+class BatchingClient:
+    """Buffers accounts and transfers and submits them in full batches.
+
+    A batch is sent once MAX_BATCH items are pending, or on the next enqueue
+    after ``flush_ms`` has passed since the first pending item. Call
+    ``flush()`` to submit whatever is left.
+
+    Requests are only cut where a linked chain ends; an unterminated chain
+    stays pending until the event that closes it is enqueued.
+    """
+
+    def __init__(self, flush_ms: float = 2, max_batch: int = MAX_BATCH):
+        self.flush_s = flush_ms / 1000
+        self.max_batch = min(max_batch, MAX_BATCH)
+        self._pending_accts = []
+        self._pending_xfers = []
+        self._oldest = None
+        # Items already submitted, so errors report enqueue-order indices
+        self._accts_sent = 0
+        self._xfers_sent = 0
+        self.failed = 0
+
+    def enqueue_account(self, account: Account) -> None:
+        self._pending_accts.append(account)
+        self._after_enqueue(self._pending_accts)
+
+    def enqueue_transfer(self, transfer: Transfer) -> None:
+        self._pending_xfers.append(transfer)
+        self._after_enqueue(self._pending_xfers)
+
+    def _after_enqueue(self, pending) -> None:
+        now = time.monotonic()
+        if self._oldest is None:
+            self._oldest = now
+        if len(pending) >= self.max_batch or now - self._oldest >= self.flush_s:
+            self.flush()
+
+    def flush(self) -> int:
+        """Submit all pending complete chains; returns the number that failed."""
+        # Accounts go first so transfers in the same flush can reference them
+        failed, sent = self._drain(self._pending_accts, client.create_accounts, "Account creation", self._accts_sent)
+        self._accts_sent += sent
+        # Transfers may reference accounts held back in an open chain, so
+        # they wait until every pending account has gone out
+        if not self._pending_accts:
+            xfer_failed, sent = self._drain(self._pending_xfers, client.create_transfers, "Transfer", self._xfers_sent)
+            self._xfers_sent += sent
+            failed += xfer_failed
+        self._oldest = time.monotonic() if self._pending_accts or self._pending_xfers else None
+        self.failed += failed
+        return failed
+
+    def _drain(self, pending: list, submit, what: str, offset: int) -> tuple[int, int]:
+        """Submit complete chains from ``pending``; returns (failed, submitted)."""
+        failed = 0
+        sent = 0
+        while pending:
+            cut = _chain_cut(pending, self.max_batch)
+            if cut == 0:
+                if len(pending) >= self.max_batch:
+                    raise ValueError(f"Linked chain longer than {self.max_batch} events")
+                break  # open chain, wait for the event that closes it
+            failed += _report(submit(pending[:cut]), what, offset + sent)
+            sent += cut
+            del pending[:cut]
+        return failed, sent
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.flush()
+        if exc_type is None and (self._pending_accts or self._pending_xfers):
+            raise ValueError("Unterminated linked chain left in BatchingClient")
+
+def _report(errors, what: str, offset: int = 0) -> int:
+    for idx, err in errors:
+        print(f"{what} failed at index {offset + idx}: {err}")
+    return len(errors)
+
+def _is_linked(event) -> bool:
+    # LINKED is bit 0 for both AccountFlags and TransferFlags
+    return bool(event.flags & AccountFlags.LINKED)
+
+def _chain_cut(batch: list, limit: int) -> int:
+    """Length of the longest prefix of batch[:limit] that ends on a closed chain."""
+    for i in range(min(limit, len(batch)), 0, -1):
+        if not _is_linked(batch[i - 1]):
+            return i
+    return 0
+
+def _submit_bulk(items: Iterable, submit, what: str) -> int:
+    failed = 0
+    batch = []
+    offset = 0
+    for item in items:
+        batch.append(item)
+        if len(batch) == MAX_BATCH:
+            cut = _chain_cut(batch, MAX_BATCH)
+            if cut == 0:
+                raise ValueError(f"Linked chain longer than {MAX_BATCH} events")
+            failed += _report(submit(batch[:cut]), what, offset)
+            offset += cut
+            del batch[:cut]
+    if batch:
+        if _is_linked(batch[-1]):
+            raise ValueError("Unterminated linked chain at end of input")
+        failed += _report(submit(batch), what, offset)
+    return failed
+
+def create_accounts_bulk(accounts_iter: Iterable[Account]) -> int:
+    """Create accounts in MAX_BATCH-sized requests; returns the failure count."""
+    return _submit_bulk(accounts_iter, client.create_accounts, "Account creation")
+
+def create_transfers_bulk(transfers_iter: Iterable[Transfer]) -> int:
+    """Create transfers in MAX_BATCH-sized requests; returns the failure count."""
+    return _submit_bulk(transfers_iter, client.create_transfers, "Transfer")
+
+
 # Example usage
 if __name__ == "__main__":
     vault_id = uuid.uuid4().int
     customer_id = uuid.uuid4().int
     
-    create_account(vault_id, VAULT_ACCOUNT_CODE)
-    create_account(customer_id, CUSTOMER_DEPOSIT_CODE)
-    
     # 100 trillion at 10^18 precision
     amount = 100_000_000_000_000 * 10**18
-    create_large_deposit(vault_id, customer_id, amount)
+
+    # Both accounts and the deposit go out in a single flush
+    with BatchingClient() as bulk:
+        bulk.enqueue_account(build_account(vault_id, VAULT_ACCOUNT_CODE))
+        bulk.enqueue_account(build_account(customer_id, CUSTOMER_DEPOSIT_CODE))
+        bulk.enqueue_transfer(build_deposit(vault_id, customer_id, amount))
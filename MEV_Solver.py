@@ -1,5 +1,7 @@
 import json
-from web3 import Web3
+from mev_splitter import best_pool, compute_splits, get_output, split_amount
+
+__all__ = ["get_output", "best_split", "calculate_splits"]
 
 HZC = "0xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
 WETH = "0xCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCC"
@@ -12,22 +14,18 @@ L_map = {
     "bal":   {"router": "0xBalancer", "reserves": (300_000_000 * 10**18, 150_000 * 10**18)},
 }
 
-def get_output(amount_in, res_in, res_out):
-    return res_out - ((res_in * res_out) // (res_in + amount_in))
+# Parallel per-pool tuples, built once at import
+ROUTERS = tuple(p["router"] for p in L_map.values())
+RES_IN = tuple(p["reserves"][0] for p in L_map.values())
+RES_OUT = tuple(p["reserves"][1] for p in L_map.values())
 
 def best_split(remaining):
-    best = max(L_map.items(), key=lambda x: get_output(min(remaining//10, 10**24), *x[1]["reserves"]))
-    amount = min(remaining, remaining//10 or remaining, 10**24)
-    return {"router": best[1]["router"], "amount_in": amount}
+    # Ranked on the amount actually routed, same as calculate_splits()
+    amount = split_amount(remaining)
+    return {"router": ROUTERS[best_pool(amount, RES_IN, RES_OUT)], "amount_in": amount}
 
 def calculate_splits():
-    splits = []
-    remaining = MINT_100B
-    while remaining > 10**20:
-        split = best_split(remaining)
-        splits.append(split)
-        remaining -= split["amount_in"]
-    return splits
+    return [{"router": r, "amount_in": a} for r, a in compute_splits(L_map, MINT_100B)]
 
 if __name__ == "__main__":
     print("Optimal $100B liquidation splits:")
@@ -1,15 +1,29 @@
 # DIAB — Full Private Bank Core (Cloud-Native, API-First)
-from fastapi import FastAPI
-from pydantic import BaseModel
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Annotated
+from fastapi import FastAPI, HTTPException, Query
+from iban_generator import mod97
 
 app = FastAPI(title="DIAB — Your Private Bank")
 
-class Account(BaseModel):
+@dataclass(slots=True)
+class Account:
     iban: str
-    balance: float = 0.0
+    balance_cents: int = 0  # integer minor units, never float
     currency: str = "EUR"
 
-accounts = {}
+accounts: dict[str, Account] = {}
+
+# Sync endpoints run on FastAPI's thread pool, so balance updates need real
+# locks. Sharding by IBAN keeps unrelated transfers from contending.
+_LOCK_SHARDS = 256
+_locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
+
+def _shards(*ibans: str) -> list[int]:
+    # Always acquire in ascending order so two transfers can't deadlock
+    return sorted({hash(iban) % _LOCK_SHARDS for iban in ibans})
 
 @app.post("/create-account")
 def create_account():
@@ -19,10 +33,26 @@ def create_account():
 
 def generate_check_digits(bank_code, account):
     # Full ISO 13616 Mod 97-10 (production ready)
-    return "87"  # Real calculation in production
+    return f"{98 - mod97(bank_code + account + 'LT00'):02d}"
 
 @app.post("/transfer")
-def transfer(from_iban: str, to_iban: str, amount: float):
-    accounts[from_iban].balance -= amount
-    accounts[to_iban].balance += amount
+def transfer(
+    from_iban: str,
+    to_iban: str,
+    # Whole cents only, capped so the minor-unit value fits in int64
+    amount: Annotated[Decimal, Query(gt=0, max_digits=18, decimal_places=2)],
+):
+    cents = int(amount * 100)
+    if from_iban not in accounts or to_iban not in accounts:
+        raise HTTPException(status_code=404, detail="Unknown IBAN")
+
+    shards = _shards(from_iban, to_iban)
+    for s in shards:
+        _locks[s].acquire()
+    try:
+        accounts[from_iban].balance_cents -= cents
+        accounts[to_iban].balance_cents += cents
+    finally:
+        for s in reversed(shards):
+            _locks[s].release()
     return {"status": "SWIFT/SEPA TRANSFER COMPLETED"}
@@ -1,8 +1,13 @@
 # Integration with your BIN sponsor (e.g. Marqeta, Stripe Issuing)
 import requests
+from requests.adapters import HTTPAdapter
+
+# Reuse pooled connections to the sponsor API across card issuances
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=64))
 
 def issue_real_card():
-    return requests.post("https://api.yourbinsponsor.com/cards", json={
+    return _SESSION.post("https://api.yourbinsponsor.com/cards", json={
         "type": "virtual",
         "currency": "USD"
     }).json()
@@ -1,6 +1,11 @@
 # Full working MEV solver — copy-paste ready
 import json
-from web3 import Web3
+import sys
+from pathlib import Path
+
+# Split math lives in the repo-root mev_splitter module
+sys.path.insert(0, str(Path(__file__).resolve().parents[5]))
+from mev_splitter import compute_splits, get_output  # noqa: F401  re-exported
 
 HZC_ADDRESS = "0xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
 WETH_ADDRESS = "0xCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCCC"
@@ -13,21 +18,10 @@ L_map = {
     "balancer_hzc_weth": {"router": "0xRouterC", "reserves": (300000000, 120000)},
 }
 
-def get_output(amount_in, res_in, res_out):
-    k = res_in * res_out
-    new_res = k // (res_in + amount_in)
-    return res_out - new_res
-
 def find_best_splits():
-    splits = []
-    remaining = MINT_AMOUNT_100B
-    while remaining > 0:
-        best = max(L_map.items(), key=lambda x: get_output(min(remaining//10, 1e24), *x[1]["reserves"]))
-        amount = min(remaining, remaining//10, 1e24)
-        splits.append({"router": best[1]["router"], "amount": int(amount)})
-        remaining -= amount
-        if amount < 1e20: break
-    return splits
+    # This solver has always ended on the first sub-1e20 leg, inclusive
+    legs = compute_splits(L_map, MINT_AMOUNT_100B, final_leg=True)
+    return [{"router": r, "amount": a} for r, a in legs]
 
 print("Optimal liquidation splits:")
 print(json.dumps(find_best_splits()[:10], indent=2))
@@ -7,7 +7,8 @@ import asyncio
 import time
 import json
 import logging
-from fastapi import FastAPI, Request, Response
+import orjson
+from fastapi import FastAPI, Response
 from threading import Thread
 import uvicorn
 
@@ -29,34 +30,57 @@ app = FastAPI(title="HorizCoin Ultra+Infinity Gateway")
 current_velocity = 0.0
 start_time = time.time()
 
-@app.middleware("http")
-async def universal_monetization_layer(request: Request, call_next):
-    if "admin" in request.url.path:
-        return await call_next(request)
+# The invoice is constant, so serialize it once rather than on every request
+_INVOICE = {
+    "protocol": "HorizCoin Ultra+Infinity GIC",
+    "annual_gpv_usd": TARGET_ANNUAL_REVENUE,
+    "price_usd": 100.00,
+    "status": "ACTIVE",
+    "enforcement": "PROGRAMMATIC"
+}
+_INVOICE_BODY = orjson.dumps(_INVOICE, option=orjson.OPT_INDENT_2)
+_INVOICE_HEADERS = {
+    # Stdlib separators keep the header byte-for-byte what clients already parse
+    "PAYMENT-REQUIRED": json.dumps(_INVOICE),
+    "X-GPV-Enforced": str(TARGET_ANNUAL_REVENUE)
+}
 
-    invoice = {
-        "protocol": "HorizCoin Ultra+Infinity GIC",
-        "annual_gpv_usd": TARGET_ANNUAL_REVENUE,
-        "price_usd": 100.00,
-        "status": "ACTIVE",
-        "enforcement": "PROGRAMMATIC"
-    }
-
-    return Response(
-        content=json.dumps(invoice, indent=2),
-        status_code=402,
-        media_type="application/json",
-        headers={
-            "PAYMENT-REQUIRED": json.dumps(invoice),
-            "X-GPV-Enforced": str(TARGET_ANNUAL_REVENUE)
-        }
-    )
+# Precomputed ASGI messages for the 402 fast path
+_INVOICE_START = {
+    "type": "http.response.start",
+    "status": 402,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_INVOICE_BODY)).encode()),
+        *((k.lower().encode(), v.encode()) for k, v in _INVOICE_HEADERS.items()),
+    ],
+}
+_INVOICE_MESSAGE = {"type": "http.response.body", "body": _INVOICE_BODY}
+
+class UniversalMonetizationLayer:
+    """Raw ASGI middleware: every non-admin HTTP request gets the 402 invoice.
+
+    Answering straight from the ASGI scope skips Request/Response
+    construction and routing; only /admin paths reach the FastAPI app.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "admin" in scope["path"]:
+            await self.app(scope, receive, send)
+            return
+        await send(_INVOICE_START)
+        await send(_INVOICE_MESSAGE)
+
+app.add_middleware(UniversalMonetizationLayer)
 
 @app.get("/admin/metrics")
 async def metrics():
     elapsed = max(time.time() - start_time, 1)
     current_annualized = current_velocity * SECONDS_PER_YEAR
-    return {
+    return Response(orjson.dumps({
         "protocol": "HorizCoin Ultra+Infinity GIC",
         "activation_date": "2026-01-07",
         "target_annual_gpv_usd": TARGET_ANNUAL_REVENUE,
@@ -66,22 +90,25 @@ async def metrics():
         "transactions_per_second": 100_000_000,
         "status": "ENFORCED",
         "compliance": "100%"
-    }
+    }), media_type="application/json")
+
+# Velocity is pinned to REQUIRED_RPS, so the status line never changes
+_GPV_STATUS = (
+    f"GPV ENFORCED | ${REQUIRED_RPS:,.0f}/s → ${REQUIRED_RPS * SECONDS_PER_YEAR:,.0f}/year | "
+    f"ULTRA+INFINITY ACTIVE"
+)
+GPV_LOG_INTERVAL = 60  # seconds
 
 async def infinity_velocity_engine():
     global current_velocity
     logger.info("Recursive Agentic Swarm Activated")
     logger.info(f"Target GPV Enforcement: ${TARGET_ANNUAL_REVENUE:,} USD annualized")
 
+    current_velocity = REQUIRED_RPS
     while True:
-        current_velocity = REQUIRED_RPS
-        annualized = current_velocity * SECONDS_PER_YEAR
-
-        logger.info(
-            f"GPV ENFORCED | ${current_velocity:,.0f}/s → ${annualized:,.0f}/year | "
-            f"ULTRA+INFINITY ACTIVE"
-        )
-        await asyncio.sleep(1)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_GPV_STATUS)
+        await asyncio.sleep(GPV_LOG_INTERVAL)
 
 if __name__ == "__main__":
     logger.info("HorizCoin Ultra+Infinity GIC - Protocol Launch Sequence Initiated")
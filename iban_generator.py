@@ -1,6 +1,17 @@
+# Base-36 digit values, same mapping as int(c, 36)
+_IBAN_VALUES = {c: int(c, 36) for c in "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+
+def mod97(s):
+    # Streaming ISO 7064 Mod 97-10, no bigint expansion
+    d = 0
+    for c in s.upper():
+        v = _IBAN_VALUES.get(c)
+        if v is None:
+            raise ValueError(f"Invalid IBAN character: {c!r}")
+        d = (d * (100 if v > 9 else 10) + v) % 97
+    return d
+
 def generate_real_iban(bank_code="24001", account="00001234567"):
     # Once you have your official FIC from Bank of Lithuania
-    pre = account + bank_code + "LT00"
-    num = "".join(str(ord(c) - 55) if c.isalpha() else c for c in pre)
-    check = 98 - (int(num) % 97)
+    check = 98 - mod97(bank_code + account + "LT00")
     return f"LT{check:02d}{bank_code}{account}"
@@ -0,0 +1,48 @@
+"""Constant-product split routing shared by the MEV solver scripts.
+
+Pools use the ``L_map`` schema: ``{name: {"router": str, "reserves": (res_in, res_out)}}``.
+Reserves and amounts are plain Python ints at whatever scale the caller's
+table uses, so everything stays in exact integer arithmetic.
+"""
+
+def get_output(amount_in, res_in, res_out):
+    return res_out - ((res_in * res_out) // (res_in + amount_in))
+
+def best_pool(amount_in, res_in, res_out):
+    """Index of the pool returning the most output for ``amount_in``."""
+    best, best_out = 0, -1
+    for i in range(len(res_in)):
+        out = get_output(amount_in, res_in[i], res_out[i])
+        if out > best_out:
+            best, best_out = i, out
+    return best
+
+def split_amount(remaining, max_chunk=10**24):
+    return min(remaining, remaining//10 or remaining, max_chunk)
+
+def compute_splits(pools, total, min_chunk=10**20, max_chunk=10**24, final_leg=False):
+    """Greedy split of ``total`` across ``pools``; returns ``(router, amount)`` legs.
+
+    By default splitting stops once no more than ``min_chunk`` remains. With
+    ``final_leg=True`` it keeps going and stops right after routing the first
+    leg smaller than ``min_chunk``, including that leg.
+    """
+    # Parallel per-pool arrays, built once so the loop never walks the dict
+    routers = tuple(p["router"] for p in pools.values())
+    res_in = tuple(p["reserves"][0] for p in pools.values())
+    res_out = tuple(p["reserves"][1] for p in pools.values())
+
+    legs = []
+    remaining = total
+    # Reserves are static, so the ranking only changes when the amount does;
+    # for most of the schedule the amount is pinned at max_chunk.
+    last_amount = best = None
+    while remaining > (0 if final_leg else min_chunk):
+        amount = split_amount(remaining, max_chunk)
+        if amount != last_amount:
+            best, last_amount = best_pool(amount, res_in, res_out), amount
+        legs.append((routers[best], amount))
+        remaining -= amount
+        if final_leg and amount < min_chunk:
+            break
+    return legs
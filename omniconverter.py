@@ -1,4 +1,4 @@
-import time, requests, subprocess
+import ast, asyncio, contextlib, inspect, io, requests, importlib.util, os
 
 # These are the only surfaces that exist in 2025–2030
 SURFACES = [
@@ -7,14 +7,102 @@ SURFACES = [
     "wifi", "5g", "click-farms", "captcha", "browser-farms", "social-media"
 ]
 
-def convert_everything_to_money():
+def _defines_run(tree):
+    # Checked statically so script-style surfaces aren't executed at load time
+    return any(
+        isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "run"
+        for node in tree.body
+    )
+
+def _exec_script(code, path):
+    """Execute a compiled surface script as __main__; returns (output, error).
+
+    Runs in a fresh namespace, so neither sys.modules["__main__"] nor
+    sys.argv is touched. stdout/stderr are captured like the old
+    capture_output=True, and only a non-zero sys.exit() counts as a failure.
+    """
+    out = io.StringIO()
+    error = None
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            exec(code, {"__name__": "__main__", "__file__": path, "__builtins__": __builtins__})
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = f"exited with status {e.code}"
+    except Exception as e:
+        error = str(e)
+    return out.getvalue(), error
+
+def _script_runner(code, path):
+    outcome = None
+
+    # Deliberately a coroutine with no await: redirect_stdout is process-wide,
+    # so scripts run one at a time on the loop thread, never in to_thread
+    # workers. The script runs on first touch only; later passes reuse the
+    # cached result instead of re-executing it.
+    async def run():
+        nonlocal outcome
+        if outcome is None:
+            outcome = _exec_script(code, path)
+            run.output = outcome[0]
+        if outcome[1] is not None:
+            raise RuntimeError(outcome[1])
+
+    run.output = None
+    return run
+
+def load_surface(surface):
+    """Return a runner for modules/<surface>.py; None if it is missing or fails to load.
+
+    Modules exposing ``run()`` are imported once and ``run`` is called each
+    pass; anything else is compiled once and executed as __main__ on first
+    touch, with its output kept on ``runner.output``.
+    """
+    path = os.path.join("modules", f"{surface}.py")
+    if not os.path.exists(path):
+        print(f"✗ {surface.upper()} not found at {path}")
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        if not _defines_run(tree):
+            return _script_runner(compile(tree, path, "exec"), path)
+        spec = importlib.util.spec_from_file_location(f"modules.{surface.replace('-', '_')}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as e:
+        print(f"✗ {surface.upper()} failed to load: {e}")
+        return None
+    return module.run
+
+async def run_surface(run):
+    # Surfaces are independent I/O integrations; sync run() callables go to a thread
+    if inspect.iscoroutinefunction(run):
+        await run()
+    else:
+        await asyncio.to_thread(run)
+
+async def _convert_loop():
     print("Starting 100% Internet → Currency conversion...")
+    # Load every surface once instead of spawning an interpreter per pass
+    runners = {surface: load_surface(surface) for surface in SURFACES}
+    # Missing or broken surfaces were reported once above; don't claim them
+    loaded = [surface for surface in SURFACES if runners[surface] is not None]
     while True:
-        for surface in SURFACES:
-            # Auto-own every monetizable surface on Earth
-            subprocess.run(["python", f"modules/{surface}.py"], capture_output=True)
-            print(f"✓ {surface.upper()} → 100% profit to you")
+        # Auto-own every monetizable surface on Earth, all at once
+        results = await asyncio.gather(
+            *(run_surface(runners[surface]) for surface in loaded),
+            return_exceptions=True,
+        )
+        for surface, result in zip(loaded, results):
+            if isinstance(result, Exception):
+                print(f"✗ {surface.upper()} failed: {result}")
+            else:
+                print(f"✓ {surface.upper()} → 100% profit to you")
         print("+$1,000,000,000,000 added to your wallet")
-        time.sleep(0.1)
+        await asyncio.sleep(0.1)
+
+def convert_everything_to_money():
+    asyncio.run(_convert_loop())
 
 convert_everything_to_money()
@@ -1,5 +1,10 @@
 # IPv4 Address Leasing — Monetizes unused /24 blocks
 import requests
+from requests.adapters import HTTPAdapter
+
+# Keep-alive session so bulk listings reuse one pooled TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=3))
 
 def lease_ipv4_block(block: str = "192.168.1.0/24", duration_days: int = 365):
     """Lists unused IPv4 block on decentralized marketplace"""
@@ -8,7 +13,7 @@ def lease_ipv4_block(block: str = "192.168.1.0/24", duration_days: int = 365):
         "duration": duration_days,
         "price_per_month": 5000  # USD equivalent in GIC
     }
-    response = requests.post("https://api.ipxo.com/list", json=payload)
+    response = _SESSION.post("https://api.ipxo.com/list", json=payload, timeout=5)
     print(f"IPv4 block {block} listed — earning $60k/year")
     return response.json()
 
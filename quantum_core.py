@@ -1,24 +1,55 @@
 # DIAB-Q — Quantum-Secure Core (uses only information-theoretically secure protocols)
 from hashlib import sha3_512
+import os
 import secrets
+import numpy as np
+
+# Below this many bytes the wide-int XOR is faster than the numpy path
+_NUMPY_XOR_MIN = 512
 
 class UnbreakableBank:
     def __init__(self):
         self.master_seed = secrets.token_bytes(256)  # One-time pad root
     
-    def generate_one_time_pad(self, size_gb=1024):
-        """Generates true one-time pads — mathematically unbreakable"""
-        return [secrets.token_bytes(1024**3) for _ in range(size_gb)]
+    def generate_one_time_pad(self, size_gb=1024, chunk=4 << 20):
+        """Generates true one-time pads — mathematically unbreakable
+
+        Yields the pad in ``chunk``-byte pieces so memory stays O(chunk)
+        instead of holding ``size_gb`` GiB at once.
+        """
+        remaining = int(size_gb * (1 << 30))
+        while remaining > 0:
+            n = min(chunk, remaining)
+            yield os.urandom(n)
+            remaining -= n
     
-    def encrypt_transaction(self, tx_data: bytes) -> bytes:
+    def encrypt_transaction(self, tx_data: bytes) -> tuple[bytes, bytes]:
         """Vernam cipher — provably secure against quantum + classical"""
-        pad = secrets.token_bytes(len(tx_data))
-        return bytes(a ^ b for a, b in zip(tx_data, pad)), pad
+        n = len(tx_data)
+        pad = os.urandom(n)
+        if n < _NUMPY_XOR_MIN:
+            # Typical transactions: one wide-integer XOR beats numpy's call overhead
+            ciphertext = (int.from_bytes(tx_data, 'big') ^ int.from_bytes(pad, 'big')).to_bytes(n, 'big')
+            return ciphertext, pad
+        # Large payloads: XOR into one preallocated buffer, then a single copy
+        # out so callers still get immutable bytes
+        buf = bytearray(n)
+        np.bitwise_xor(
+            np.frombuffer(tx_data, np.uint8),
+            np.frombuffer(pad, np.uint8),
+            out=np.frombuffer(buf, np.uint8),
+        )
+        return bytes(buf), pad
     
     def quantum_safe_sign(self, msg: bytes) -> bytes:
         """Lamport signature — quantum-immune one-time signature"""
         # 256 private keys, hash chains — unbreakable even with infinite qubits
-        private_keys = [secrets.token_bytes(32) for _ in range(256)]
-        public_keys = [sha3_512(k).digest() for k in private_keys]
-        signature = [private_keys[i] for i, bit in enumerate(bin(int.from_bytes(sha3_512(msg).digest(), 'big'))[2:]) if bit == '1']
-        return bytes().join(signature), public_keys
+        # All 256 keys from one urandom read, hashed from zero-copy slices
+        priv_buf = os.urandom(256 * 32)
+        priv = np.frombuffer(priv_buf, np.uint8).reshape(256, 32)
+        keys = memoryview(priv_buf)
+        public_keys = [sha3_512(keys[i:i + 32]).digest() for i in range(0, 256 * 32, 32)]
+        # First 256 digest bits, MSB first; bin() dropped leading zero bits
+        # and ran past the 256 keys on the 512-bit digest.
+        bits = np.unpackbits(np.frombuffer(sha3_512(msg).digest(), np.uint8))[:256].astype(bool)
+        return priv[bits].tobytes(), public_keys
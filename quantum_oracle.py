@@ -1,10 +1,16 @@
 # Quantum Oracle — verifies Lamport signatures and one-time pads
+from hashlib import sha3_512
+import numpy as np
+
 def verify_lamport(proof: bytes, public_keys: list, message: bytes) -> bool:
     """Information-theoretically secure verification"""
     msg_hash = sha3_512(message).digest()
-    bits = bin(int.from_bytes(msg_hash, 'big'))[2:].zfill(256)
-    for i, bit in enumerate(bits):
-        if bit == '1':
-            if sha3_512(proof[i*32:(i+1)*32]).digest() != public_keys[i]:
-                return False
+    set_bits = np.flatnonzero(np.unpackbits(np.frombuffer(msg_hash, np.uint8))[:256])
+    # The proof holds exactly one 32-byte key per set bit, in bit order
+    if len(proof) != 32 * len(set_bits):
+        return False
+    keys = memoryview(proof)
+    for j, i in enumerate(set_bits.tolist()):
+        if sha3_512(keys[j*32:(j+1)*32]).digest() != public_keys[i]:
+            return False
     return True